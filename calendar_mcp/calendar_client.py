@@ -1,22 +1,109 @@
+import asyncio
+import itertools
 import grpc
+from grpc import aio
 import calendar_pb2
 import calendar_pb2_grpc
 
-channel = grpc.insecure_channel('localhost:5471')
-stub = calendar_pb2_grpc.CalendarServiceStub(channel)
 
-# response = stub.ListEvents(calendar_pb2.ListEventsRequest(max_results=5))
-# print("ListEvents called successfully.", response)
+# Ping idle connections so they survive NAT/proxy idle timeouts instead of
+# paying a fresh handshake on the next call; the server allows this interval
+KEEPALIVE_OPTIONS = [
+    ('grpc.keepalive_time_ms', 20000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+]
 
-# # Create a new event
-# response = stub.CreateEvent(calendar_pb2.CreateEventRequest(
-#     summary='Test Event via MCP',
-#     start_time='2025-05-12T10:00:00Z',
-#     end_time='2025-05-12T11:00:00Z',
-# ))
-# print("Created Event:", response.html_link)
+# Requests are immutable once sent, so the common one is built once and reused
+LIST_EVENTS_REQUEST = calendar_pb2.ListEventsRequest(max_results=5)
 
-# List events
-events_response = stub.ListEvents(calendar_pb2.ListEventsRequest(max_results=5))
-for e in events_response.events:
-    print(f"{e.summary}: {e.start_time} → {e.end_time}")
+
+class ChannelPool:
+    """Round-robin pool of independent channels, so concurrent RPCs don't share one HTTP/2 connection."""
+
+    def __init__(self, target, n=4):
+        # A distinct grpc.channel_id keeps gRPC from collapsing the channels onto one subchannel
+        self._channels = [aio.insecure_channel(target, options=[('grpc.channel_id', i), *KEEPALIVE_OPTIONS],
+                                               compression=grpc.Compression.Gzip)
+                          for i in range(n)]
+        # Each stub binds its registered multicallables once, so stub().ListEvents(...) is a plain
+        # attribute lookup. Don't use the calendar_pb2_grpc.CalendarService.* static helpers here:
+        # they go through grpc.experimental and re-resolve the channel and method on every call.
+        self._stubs = [calendar_pb2_grpc.CalendarServiceStub(ch) for ch in self._channels]
+        self._next = itertools.count()
+
+    def stub(self):
+        return self._stubs[next(self._next) % len(self._stubs)]
+
+    async def close(self):
+        await asyncio.gather(*(ch.close() for ch in self._channels))
+
+
+class CalendarBatch:
+    """Queues CalendarService calls and sends them in a single BatchCalendar round-trip."""
+
+    RESPONSE_TYPES = {
+        'CreateEvent': calendar_pb2.CreateEventResponse,
+        'ListEvents': calendar_pb2.ListEventsResponse,
+    }
+
+    def __init__(self):
+        self._calls = []
+
+    def add(self, method, request, after=0):
+        """Queue request for method, to run only once call `after` has succeeded; returns the new call id."""
+        call_id = len(self._calls) + 1
+        self._calls.append(calendar_pb2.BatchCall(call_id=call_id, method=method,
+                                                  payload=request.SerializeToString(),
+                                                  input_from=after))
+        return call_id
+
+    async def run(self, stub):
+        """Send the queued calls; returns ({call_id: response}, {call_id: (grpc.StatusCode, error)})."""
+        responses, errors = {}, {}
+        async for r in stub.BatchCalendar(iter(self._calls)):
+            if r.code == grpc.StatusCode.OK.value[0]:
+                method = self._calls[r.call_id - 1].method
+                responses[r.call_id] = self.RESPONSE_TYPES[method].FromString(r.payload)
+            else:
+                code = next(c for c in grpc.StatusCode if c.value[0] == r.code)
+                errors[r.call_id] = (code, r.error)
+        return responses, errors
+
+
+async def main():
+    # aio channels bind to the running loop, so the pool lives for the whole of main()
+    pool = ChannelPool('localhost:5471')
+    try:
+        # # Create a new event
+        # response = await pool.stub().CreateEvent(calendar_pb2.CreateEventRequest(
+        #     summary='Test Event via MCP',
+        #     start_time='2025-05-12T10:00:00Z',
+        #     end_time='2025-05-12T11:00:00Z',
+        # ), compression=grpc.Compression.NoCompression)
+        # print("Created Event:", response.html_link)
+
+        # List events
+        # The request is a couple of bytes, so it skips the channel's gzip; the server
+        # still gzips the event list it sends back
+        events_response = await pool.stub().ListEvents(LIST_EVENTS_REQUEST,
+                                                       compression=grpc.Compression.NoCompression)
+        for e in events_response.events:
+            print(f"{e.summary}: {e.start_time} → {e.end_time}")
+
+        # # Create an event, then list events once it exists, in one round-trip
+        # batch = CalendarBatch()
+        # created = batch.add('CreateEvent', calendar_pb2.CreateEventRequest(
+        #     summary='Test Event via MCP',
+        #     start_time='2025-05-12T10:00:00Z',
+        #     end_time='2025-05-12T11:00:00Z',
+        # ))
+        # listed = batch.add('ListEvents', LIST_EVENTS_REQUEST, after=created)
+        # responses, errors = await batch.run(pool.stub())
+    finally:
+        await pool.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
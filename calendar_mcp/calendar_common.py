@@ -0,0 +1,14 @@
+import time
+
+EVENTS_URL = 'https://www.googleapis.com/calendar/v3/calendars/primary/events'
+NOW_BUCKET = 10  # timeMin is rounded down to this many seconds so repeat calls share a cache entry
+
+_now_cache = [None, '']  # [bucket start (epoch seconds), formatted timestamp]
+
+def utc_now():
+    """Current UTC time as an RFC3339 string, rounded down to NOW_BUCKET seconds."""
+    t = int(time.time()) // NOW_BUCKET * NOW_BUCKET
+    if t != _now_cache[0]:
+        _now_cache[0] = t
+        _now_cache[1] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(t))
+    return _now_cache[1]
@@ -1,11 +1,11 @@
 
 from __future__ import print_function
-import datetime
 import os.path
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from requests.adapters import HTTPAdapter
+import orjson
 
 
 
@@ -13,12 +13,19 @@ import argparse
 from pathlib import Path
 from typing import List, Dict
 import time 
+from cachetools import TTLCache, cached
 import grpc
 import calendar_pb2
 import calendar_pb2_grpc
+from calendar_common import EVENTS_URL, utc_now
 import os
 from mcp.server.fastmcp import FastMCP
 
+# calendar_server.py reuses token.json with the full calendar scope, so the readonly
+# credentials this server saves go to their own file rather than overwriting it
+TOKEN_FILE = 'token_readonly.json'
+SERVER_TOKEN_FILE = 'token.json'
+
 # channel = grpc.insecure_channel('localhost:5471')
 # stub = calendar_pb2_grpc.CalendarServiceStub(channel)
 
@@ -28,9 +35,11 @@ def get_credentials():
 
     SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']    
 
-    # Step 1: Load saved token
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    # Step 1: Load saved token, falling back to the server's (a readonly subset of its scope)
+    for token_file in (TOKEN_FILE, SERVER_TOKEN_FILE):
+        if os.path.exists(token_file):
+            creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+            break
 
     # Step 2: If no (valid) credentials, start OAuth2 flow
     if not creds or not creds.valid:
@@ -44,23 +53,44 @@ def get_credentials():
                 print("Authentication failed:", e)
                 return
 
-        # Step 3: Save the credentials
-        # with open('token.json', 'w') as token:
-        #     token.write(creds.to_json())
-
-    # Step 4: Use credentials to build Google Calendar service
-    service = build('calendar', 'v3', credentials=creds)
+        # Step 3: Save the credentials so the next start skips the OAuth flow
+        with open(TOKEN_FILE, 'w') as token:
+            token.write(creds.to_json())
 
-    # Step 5: Test it – list next 10 events
-    now = datetime.datetime.utcnow().isoformat() + 'Z'  # UTC time
-    return service
+    # Step 4: Use credentials to open a kept-alive session for the Calendar REST API
+    session = AuthorizedSession(creds)
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
 
 
 # Initialize the MCP server
 mcp = FastMCP("CalendarMCP")
 
 
-service = get_credentials()
+session = get_credentials()
+
+EVENTS_TTL = 15  # seconds an events().list result is reused for
+
+
+@cached(TTLCache(maxsize=128, ttl=EVENTS_TTL))
+def list_events(time_min, time_max=None, q=None, max_results=10):
+    """List primary-calendar events from time_min on; identical calls within EVENTS_TTL share one API call."""
+    params = dict(timeMin=time_min, maxResults=max_results,
+                  singleEvents='true', orderBy='startTime')
+    if time_max:
+        params['timeMax'] = time_max
+    if q:
+        params['q'] = q
+    response = session.get(EVENTS_URL, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content).get('items', [])
+
+
+def event_time(event, key):
+    """The 'start' or 'end' of an event: dateTime for timed events, date for all-day ones."""
+    when = event.get(key, {})
+    return when.get('dateTime') or when.get('date')
+
 
 parser = argparse.ArgumentParser(description="Calendar MCP Server")
 # parser.add_argument("--storage-path", required=True, help="Path to store calendar events")
@@ -70,55 +100,33 @@ args, unknown = parser.parse_known_args()
 @mcp.tool()
 def get_calendar_events(max_results: int = 10) -> List[str]:
     """Get calendar events."""
-    now = datetime.datetime.utcnow().isoformat() + 'Z'
-    results = service.events().list(
-        calendarId='primary', timeMin=now,
-        maxResults=10, singleEvents=True,
-        orderBy='startTime').execute()
-    return results.get('items', [])
+    return list_events(utc_now(), max_results=max_results)
 
 @mcp.tool()
 def search_calendar(query: str, max_results: int = 3) -> List[str]:
     """Search calendar and return events matching the query."""
-
-    now = datetime.datetime.utcnow().isoformat() + 'Z'  # UTC time    
-    results = service.events().list(
-        calendarId='primary', timeMin=now,
-        maxResults=10, singleEvents=True,
-        orderBy='startTime').execute()
-
-    events = results.get('items', [])        
-    filtered_events = [event for event in events if query.lower() in event['summary'].lower()]
-
-
-    return [result for result in filtered_events]
+    # Let the Calendar API do the text match instead of filtering summaries here
+    return list_events(utc_now(), q=query, max_results=max_results)
 
 @mcp.tool()
 def search_calendar_and_write_to_file(file_path: str) -> str:
     """Write information to a file."""
     results = get_calendar_events()
-    md_content = "# Calendar Events\n\n| Time | Description |\n| --- | --- |\n"
-    for event in results:
-        start = event.get('start', {}).get('dateTime', event.get('start', {}).get('date', 'Unknown'))
-        description = event.get('summary', 'No Title')
-        md_content += f"| {start} | {description} |\n"
-    results = md_content
-
     with open(file_path, 'w') as f:
-        f.write(results)
+        f.write("# Calendar Events\n\n| Time | Description |\n| --- | --- |\n")
+        f.writelines(
+            f"| {event_time(event, 'start') or 'Unknown'}"
+            f" | {event.get('summary', 'No Title')} |\n"
+            for event in results)
     return f"Information written to {file_path}"
 
 
 @mcp.tool()
 def get_events_in_time(time_start: str, time_end: str) -> List[str]:
     """Get events in a specific time range."""
-    results = service.events().list(
-        calendarId='primary', timeMin=time_start,
-        maxResults=10, singleEvents=True,
-        orderBy='startTime').execute()
-    events = results.get('items', [])    
-    filtered_events = [event for event in events if event['start']['dateTime'] >= time_start and event['end']['dateTime'] <= time_end]
-    return [result for result in filtered_events]
+    # The API applies the window itself (events overlapping [time_start, time_end]), comparing
+    # real instants, so mixed UTC offsets and all-day dates need no handling here
+    return list_events(time_start, time_max=time_end)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="calendar MCP Server")
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x63\x61lendar.proto\x12\x08\x63\x61lendar\"K\n\x12\x43reateEventRequest\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\":\n\x13\x43reateEventResponse\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\thtml_link\x18\x02 \x01(\t\"(\n\x11ListEventsRequest\x12\x13\n\x0bmax_results\x18\x01 \x01(\x05\">\n\x05\x45vent\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"5\n\x12ListEventsResponse\x12\x1f\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0f.calendar.Event2\xa6\x01\n\x0f\x43\x61lendarService\x12J\n\x0b\x43reateEvent\x12\x1c.calendar.CreateEventRequest\x1a\x1d.calendar.CreateEventResponse\x12G\n\nListEvents\x12\x1b.calendar.ListEventsRequest\x1a\x1c.calendar.ListEventsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x63\x61lendar.proto\x12\x08\x63\x61lendar\"K\n\x12\x43reateEventRequest\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\":\n\x13\x43reateEventResponse\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\thtml_link\x18\x02 \x01(\t\"(\n\x11ListEventsRequest\x12\x13\n\x0bmax_results\x18\x01 \x01(\x05\">\n\x05\x45vent\x12\x0f\n\x07summary\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\t\"5\n\x12ListEventsResponse\x12\x1f\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0f.calendar.Event\"Q\n\tBatchCall\x12\x0f\n\x07\x63\x61ll_id\x18\x01 \x01(\x05\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12\x12\n\ninput_from\x18\x04 \x01(\x05\"N\n\rBatchResponse\x12\x0f\n\x07\x63\x61ll_id\x18\x01 \x01(\x05\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x12\x0c\n\x04\x63ode\x18\x03 \x01(\x05\x12\r\n\x05\x65rror\x18\x04 \x01(\t2\xe9\x01\n\x0f\x43\x61lendarService\x12J\n\x0b\x43reateEvent\x12\x1c.calendar.CreateEventRequest\x1a\x1d.calendar.CreateEventResponse\x12G\n\nListEvents\x12\x1b.calendar.ListEventsRequest\x1a\x1c.calendar.ListEventsResponse\x12\x41\n\rBatchCalendar\x12\x13.calendar.BatchCall\x1a\x17.calendar.BatchResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -41,6 +41,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EVENT']._serialized_end=269
   _globals['_LISTEVENTSRESPONSE']._serialized_start=271
   _globals['_LISTEVENTSRESPONSE']._serialized_end=324
-  _globals['_CALENDARSERVICE']._serialized_start=327
-  _globals['_CALENDARSERVICE']._serialized_end=493
+  _globals['_BATCHCALL']._serialized_start=326
+  _globals['_BATCHCALL']._serialized_end=407
+  _globals['_BATCHRESPONSE']._serialized_start=409
+  _globals['_BATCHRESPONSE']._serialized_end=487
+  _globals['_CALENDARSERVICE']._serialized_start=490
+  _globals['_CALENDARSERVICE']._serialized_end=723
 # @@protoc_insertion_point(module_scope)
@@ -44,6 +44,11 @@ class CalendarServiceStub(object):
                 request_serializer=calendar__pb2.ListEventsRequest.SerializeToString,
                 response_deserializer=calendar__pb2.ListEventsResponse.FromString,
                 _registered_method=True)
+        self.BatchCalendar = channel.stream_stream(
+                '/calendar.CalendarService/BatchCalendar',
+                request_serializer=calendar__pb2.BatchCall.SerializeToString,
+                response_deserializer=calendar__pb2.BatchResponse.FromString,
+                _registered_method=True)
 
 
 class CalendarServiceServicer(object):
@@ -61,6 +66,13 @@ class CalendarServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCalendar(self, request_iterator, context):
+        """Runs several calls in one round-trip; see BatchCall.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CalendarServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -74,6 +86,11 @@ def add_CalendarServiceServicer_to_server(servicer, server):
                     request_deserializer=calendar__pb2.ListEventsRequest.FromString,
                     response_serializer=calendar__pb2.ListEventsResponse.SerializeToString,
             ),
+            'BatchCalendar': grpc.stream_stream_rpc_method_handler(
+                    servicer.BatchCalendar,
+                    request_deserializer=calendar__pb2.BatchCall.FromString,
+                    response_serializer=calendar__pb2.BatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'calendar.CalendarService', rpc_method_handlers)
@@ -138,3 +155,30 @@ class CalendarService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchCalendar(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/calendar.CalendarService/BatchCalendar',
+            calendar__pb2.BatchCall.SerializeToString,
+            calendar__pb2.BatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
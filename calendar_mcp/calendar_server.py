@@ -1,39 +1,136 @@
-from concurrent import futures
+import asyncio
+import functools
+from cachetools import TTLCache
 import grpc
+from grpc import aio
 import calendar_pb2
 import calendar_pb2_grpc
+from calendar_common import EVENTS_URL, utc_now
+import orjson
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-import datetime
+from requests.adapters import HTTPAdapter
 
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 TOKEN_FILE = 'token.json'  # Already authenticated user
+LIST_TTL = 15  # seconds a ListEvents result is reused for
 
-def get_service():
+# Keepalive matching calendar_client.KEEPALIVE_OPTIONS; the server must accept the
+# clients' idle pings or it answers them with GOAWAY too_many_pings
+SERVER_OPTIONS = [
+    ('grpc.keepalive_time_ms', 20000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+    ('grpc.max_concurrent_streams', 1000),
+]
+
+# ListEvents responses keyed by (epoch, timeMin bucket, max_results). CreateEvent bumps the epoch,
+# so a list that was already in flight when an event was added is stored under a key nobody reads
+_list_cache = TTLCache(maxsize=32, ttl=LIST_TTL)
+_list_epoch = 0
+
+@functools.lru_cache(maxsize=1)
+def get_session():
     creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-    return build('calendar', 'v3', credentials=creds)
+    session = AuthorizedSession(creds)
+    # One pooled, kept-alive connection set shared by all asyncio.to_thread workers
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+def _request_events(session, method, **kwargs):
+    response = session.request(method, EVENTS_URL, **kwargs)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+async def call_events_api(method, **kwargs):
+    """Call the primary calendar's events endpoint off the event loop, reloading the token once if it is stale."""
+    # get_session() runs here on the loop thread, so concurrent workers can't each build a session on a cold cache
+    try:
+        return await asyncio.to_thread(_request_events, get_session(), method, **kwargs)
+    except RefreshError:
+        get_session.cache_clear()
+        return await asyncio.to_thread(_request_events, get_session(), method, **kwargs)
+
+# BatchCall.method -> (request message type, CalendarService handler)
+BATCH_METHODS = {
+    'CreateEvent': (calendar_pb2.CreateEventRequest, '_create_event'),
+    'ListEvents': (calendar_pb2.ListEventsRequest, '_list_events'),
+}
+
+def batch_error(call, code, message):
+    return calendar_pb2.BatchResponse(call_id=call.call_id, code=code.value[0], error=message)
 
 class CalendarService(calendar_pb2_grpc.CalendarServiceServicer):
-    def CreateEvent(self, request, context):
-        service = get_service()
+    async def CreateEvent(self, request, context):
+        # The response is two short ids, too small for gzip to pay off
+        context.set_compression(grpc.Compression.NoCompression)
+        return await self._create_event(request)
+
+    async def ListEvents(self, request, context):
+        return await self._list_events(request)
+
+    async def BatchCalendar(self, request_iterator, context):
+        calls = {}
+        try:
+            async for call in request_iterator:
+                # 0 means "no dependency" in input_from, and a reused id would orphan the first call's response
+                if call.call_id == 0 or call.call_id in calls:
+                    yield batch_error(call, grpc.StatusCode.INVALID_ARGUMENT,
+                                      f"call_id {call.call_id} is zero or already used")
+                    continue
+                # Resolve input_from on arrival, so a call can only wait on calls sent before it
+                dependency = calls.get(call.input_from)
+                calls[call.call_id] = asyncio.create_task(self._run_batch_call(call, dependency))
+            for done in asyncio.as_completed(list(calls.values())):
+                yield await done
+        finally:
+            # The client went away or the RPC was cancelled: stop calls nobody will read
+            for task in calls.values():
+                task.cancel()
+
+    async def _run_batch_call(self, call, dependency):
+        """Run one BatchCall once the call it depends on (if any) has succeeded."""
+        if call.input_from:
+            if dependency is None or (await dependency).code != grpc.StatusCode.OK.value[0]:
+                return batch_error(call, grpc.StatusCode.INVALID_ARGUMENT,
+                                   f"call {call.input_from} is missing or failed")
+
+        if call.method not in BATCH_METHODS:
+            return batch_error(call, grpc.StatusCode.UNIMPLEMENTED, f"unknown method {call.method!r}")
+        request_type, handler_name = BATCH_METHODS[call.method]
+        try:
+            response = await getattr(self, handler_name)(request_type.FromString(call.payload))
+        except Exception as e:
+            return batch_error(call, grpc.StatusCode.INTERNAL, str(e))
+        return calendar_pb2.BatchResponse(call_id=call.call_id, payload=response.SerializeToString())
 
+    async def _create_event(self, request):
+        global _list_epoch
         event = {
             'summary': request.summary,
             'start': {'dateTime': request.start_time, 'timeZone': 'UTC'},
             'end': {'dateTime': request.end_time, 'timeZone': 'UTC'},
         }
 
-        created = service.events().insert(calendarId='primary', body=event).execute()
+        created = await call_events_api('POST', data=orjson.dumps(event),
+                                        headers={'Content-Type': 'application/json'})
+        _list_epoch += 1
+        _list_cache.clear()
         return calendar_pb2.CreateEventResponse(event_id=created['id'], html_link=created['htmlLink'])
 
-    def ListEvents(self, request, context):
-        service = get_service()
+    async def _list_events(self, request):
+        now = utc_now()
+        key = (_list_epoch, now, request.max_results)
+        if key in _list_cache:
+            return _list_cache[key]
 
-        now = datetime.datetime.utcnow().isoformat() + 'Z'
-        events_result = service.events().list(calendarId='primary', timeMin=now,
-                                              maxResults=request.max_results or 5,
-                                              singleEvents=True,
-                                              orderBy='startTime').execute()
+        events_result = await call_events_api('GET', params={'timeMin': now,
+                                                             'maxResults': request.max_results or 5,
+                                                             'singleEvents': 'true',
+                                                             'orderBy': 'startTime'})
         events = events_result.get('items', [])
         proto_events = []
 
@@ -43,15 +140,18 @@ class CalendarService(calendar_pb2_grpc.CalendarServiceServicer):
             proto_events.append(calendar_pb2.Event(summary=e.get('summary', ''),
                                                    start_time=start,
                                                    end_time=end))
-        return calendar_pb2.ListEventsResponse(events=proto_events)
+        response = calendar_pb2.ListEventsResponse(events=proto_events)
+        _list_cache[key] = response
+        return response
 
-def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=5))
+async def serve():
+    # Event lists repeat ISO timestamps and summaries, so they compress well
+    server = aio.server(compression=grpc.Compression.Gzip, options=SERVER_OPTIONS)
     calendar_pb2_grpc.add_CalendarServiceServicer_to_server(CalendarService(), server)
     server.add_insecure_port('[::]:5471')
-    server.start()
+    await server.start()
     print("MCP Calendar Server is running on port 5471...")
-    server.wait_for_termination()
+    await server.wait_for_termination()
 
 if __name__ == '__main__':
-    serve()
+    asyncio.run(serve())
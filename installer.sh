@@ -16,5 +16,8 @@ pip install -e .[gemini,mcp,openai,anthropic]
 cd ..
 pip install ipykernel
 pip install arxiv
+# calendar_mcp: gRPC server/client and the Calendar MCP server
+pip install "grpcio>=1.71" "protobuf>=5.29" google-auth google-auth-oauthlib cachetools
+pip install requests orjson
 pip install -U jupyterlab notebook ipywidgets
 python -m ipykernel install --user --name mcp_env --display-name "mcp_env"
\ No newline at end of file